@@ -63,7 +63,12 @@ from mcp_common.profiles import FullServer, MinimalServer, StandardServer
 from mcp_common.schemas import ToolInput, ToolResponse
 from mcp_common.tools import MANDATORY_TOOLS, ToolProfile, trim_description
 from mcp_common.ui import ServerPanels
-from mcp_common.validation import validate_input, validate_output
+from mcp_common.validation import (
+    register_msgspec,
+    validate_input,
+    validate_output,
+    validate_output_trusted,
+)
 
 # Read the version from package metadata so it stays in sync with releases.
 # Falls back to a dev sentinel if the package is imported without being
@@ -109,7 +114,9 @@ __all__: list[str] = [
     "__version__",
     "ensure_dual_use",
     "register_health_tools",
+    "register_msgspec",
     "trim_description",
     "validate_input",
     "validate_output",
+    "validate_output_trusted",
 ]
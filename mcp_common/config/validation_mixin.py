@@ -21,6 +21,55 @@ try:
 except ImportError:
     EXCEPTIONS_AVAILABLE = False
 
+_MAX_PORT = 65535
+
+# Error message templates; ``ctx`` is the optional context prefix.
+_FMT_NOT_SET = "{ctx}{name} is not set in configuration"
+_FMT_TOO_SHORT = "{ctx}{name} is too short. Required: {n} characters, got: {got}"
+_FMT_PASSWORD_TOO_SHORT = (
+    "{ctx}password is too short. Minimum: {n} characters, got: {got}"
+)
+_FMT_PORT_RANGE = "{ctx}port must be between 1 and 65535, got: {port}"
+_FMT_ONE_OF = "{ctx}At least one of [{names}] is required"
+
+
+def _is_blank(value: str | None) -> bool:
+    """Return True for None, empty, or whitespace-only strings.
+
+    ``str.isspace()`` scans in place, unlike ``strip()`` which allocates.
+    """
+    return not value or value.isspace()
+
+
+def _raise_server_config_error(
+    message: str,
+    field: str,
+    value: str | None = None,
+    *,
+    credential: bool = False,
+) -> t.NoReturn:
+    """Raise ServerConfigurationError (or CredentialValidationError)."""
+    if credential:
+        raise CredentialValidationError(message=message, field=field)
+    raise ServerConfigurationError(message=message, field=field, value=value)
+
+
+def _raise_valueerror(
+    message: str,
+    field: str,
+    value: str | None = None,
+    *,
+    credential: bool = False,
+) -> t.NoReturn:
+    """Raise a plain ValueError when mcp_common.exceptions is unavailable."""
+    raise ValueError(message)
+
+
+# Chosen once at import so validators never re-check EXCEPTIONS_AVAILABLE.
+_raise_config_error = (
+    _raise_server_config_error if EXCEPTIONS_AVAILABLE else _raise_valueerror
+)
+
 
 class ValidationMixin:
     """Reusable validation methods for MCP server settings.
@@ -62,16 +111,13 @@ class ValidationMixin:
             ServerConfigurationError: If field is None or empty (when exceptions available)
             ValueError: Falls back to ValueError if exceptions unavailable
         """
-        if not value or not value.strip():
-            prefix = f"{context} " if context else ""
-            msg = f"{prefix}{field_name} is not set in configuration"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise ServerConfigurationError(
-                    message=msg,
-                    field=field_name,
-                )
-            raise ValueError(msg)
+        if not _is_blank(value):
+            return
+
+        _raise_config_error(
+            _FMT_NOT_SET.format(ctx=f"{context} " if context else "", name=field_name),
+            field_name,
+        )
 
     @staticmethod
     def validate_min_length(
@@ -92,67 +138,17 @@ class ValidationMixin:
             ServerConfigurationError: If value is too short (when exceptions available)
             ValueError: Falls back to ValueError if exceptions unavailable
         """
-        if len(value) < min_length:
-            prefix = f"{context} " if context else ""
-            msg = (
-                f"{prefix}{field_name} is too short. "
-                f"Required: {min_length} characters, got: {len(value)}"
-            )
-
-            if EXCEPTIONS_AVAILABLE:
-                raise ServerConfigurationError(
-                    message=msg,
-                    field=field_name,
-                    value=f"{len(value)} characters",
-                )
-            raise ValueError(msg)
-
-    @staticmethod
-    def _validate_username(username: str | None, context: str | None) -> None:
-        """Helper to validate the username."""
-        if not username or not username.strip():
-            prefix = f"{context} " if context else ""
-            msg = f"{prefix}username is not set in configuration"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise CredentialValidationError(
-                    message=msg,
-                    field="username",
-                )
-            raise ValueError(msg)
-
-    @staticmethod
-    def _validate_password(password: str | None, context: str | None) -> None:
-        """Helper to validate the password."""
-        if not password or not password.strip():
-            prefix = f"{context} " if context else ""
-            msg = f"{prefix}password is not set in configuration"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise CredentialValidationError(
-                    message=msg,
-                    field="password",
-                )
-            raise ValueError(msg)
-
-    @staticmethod
-    def _validate_password_strength(
-        password: str, min_password_length: int, context: str | None
-    ) -> None:
-        """Helper to validate password strength."""
-        if len(password) < min_password_length:
-            prefix = f"{context} " if context else ""
-            msg = (
-                f"{prefix}password is too short. "
-                f"Minimum: {min_password_length} characters, got: {len(password)}"
-            )
-
-            if EXCEPTIONS_AVAILABLE:
-                raise CredentialValidationError(
-                    message=msg,
-                    field="password",
-                )
-            raise ValueError(msg)
+        length = len(value)
+        if length >= min_length:
+            return
+
+        msg = _FMT_TOO_SHORT.format(
+            ctx=f"{context} " if context else "",
+            name=field_name,
+            n=min_length,
+            got=length,
+        )
+        _raise_config_error(msg, field_name, f"{length} characters")
 
     def validate_credentials(
         self,
@@ -176,15 +172,32 @@ class ValidationMixin:
             CredentialValidationError: If credentials are invalid (when exceptions available)
             ValueError: Falls back to ValueError if exceptions unavailable
         """
-        # Validate username
-        self._validate_username(username, context)
+        # Checks are inlined (no helper calls) since this runs on every config load
+        ctx = f"{context} " if context else ""
+
+        if not username or username.isspace():
+            _raise_config_error(
+                _FMT_NOT_SET.format(ctx=ctx, name="username"),
+                "username",
+                credential=True,
+            )
 
-        # Validate password
-        self._validate_password(password, context)
+        if not password or password.isspace():
+            _raise_config_error(
+                _FMT_NOT_SET.format(ctx=ctx, name="password"),
+                "password",
+                credential=True,
+            )
 
-        # Only validate strength if password is provided
-        if password:
-            self._validate_password_strength(password, min_password_length, context)
+        password_length = len(password)
+        if password_length < min_password_length:
+            _raise_config_error(
+                _FMT_PASSWORD_TOO_SHORT.format(
+                    ctx=ctx, n=min_password_length, got=password_length
+                ),
+                "password",
+                credential=True,
+            )
 
     @staticmethod
     def validate_url_parts(
@@ -204,32 +217,22 @@ class ValidationMixin:
             ValueError: Falls back to ValueError if exceptions unavailable
         """
         # Validate host
-        if not host or not host.strip():
-            prefix = f"{context} " if context else ""
-            msg = f"{prefix}host is not set in configuration"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise ServerConfigurationError(
-                    message=msg,
-                    field="host",
-                )
-            raise ValueError(msg)
+        if _is_blank(host):
+            _raise_config_error(
+                _FMT_NOT_SET.format(ctx=f"{context} " if context else "", name="host"),
+                "host",
+            )
 
-        # Validate port if provided
-        max_port = 65535
-        if port is not None and (
-            not isinstance(port, int) or port < 1 or port > max_port
-        ):
-            prefix = f"{context} " if context else ""
-            msg = f"{prefix}port must be between 1 and 65535, got: {port}"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise ServerConfigurationError(
-                    message=msg,
-                    field="port",
-                    value=str(port),
-                )
-            raise ValueError(msg)
+        # Validate port if provided. ``type(...) is int`` is an exact check, so
+        # bools (an int subclass) are rejected rather than treated as 0/1.
+        if port is None or (type(port) is int and 1 <= port <= _MAX_PORT):
+            return
+
+        _raise_config_error(
+            _FMT_PORT_RANGE.format(ctx=f"{context} " if context else "", port=port),
+            "port",
+            str(port),
+        )
 
     @staticmethod
     def validate_one_of_required(
@@ -254,20 +257,20 @@ class ValidationMixin:
             msg = "field_names and values must have same length"
             raise ValueError(msg)
 
-        # Check if any value is not None/empty
-        has_value = any(v is not None and str(v).strip() for v in values)
-
-        if not has_value:
-            prefix = f"{context}: " if context else ""
-            field_list = ", ".join(field_names)
-            msg = f"{prefix}At least one of [{field_list}] is required"
-
-            if EXCEPTIONS_AVAILABLE:
-                raise ServerConfigurationError(
-                    message=msg,
-                    field="multiple_fields",
-                )
-            raise ValueError(msg)
+        # Any non-None value counts as set, except blank strings. Non-strings are
+        # not stringified, so large containers cost nothing to check.
+        if any(
+            v is not None and (not isinstance(v, str) or not _is_blank(v))
+            for v in values
+        ):
+            return
+
+        _raise_config_error(
+            _FMT_ONE_OF.format(
+                ctx=f"{context}: " if context else "", names=", ".join(field_names)
+            ),
+            "multiple_fields",
+        )
 
 
 __all__ = ["ValidationMixin"]
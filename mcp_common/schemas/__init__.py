@@ -27,6 +27,8 @@ Example:
 
 from __future__ import annotations
 
+import copy
+import functools
 from typing import Any
 
 from pydantic import BaseModel, Field, StrictBool
@@ -125,6 +127,25 @@ class ToolResponse(BaseModel):
         },
     }
 
+    @classmethod
+    @functools.cache
+    def _schema_examples(cls) -> tuple[dict[str, Any], ...]:
+        """Build the JSON Schema examples once per model class."""
+        return tuple(cls.model_json_schema()["examples"])
+
+    @classmethod
+    def cached_examples(cls) -> list[dict[str, Any]]:
+        """Return the JSON Schema examples, building the schema only once per class.
+
+        ``model_json_schema()`` walks the full core schema on every call, so the
+        examples are memoized per model class. Each call returns a fresh deep
+        copy, so callers may mutate the result without affecting later calls.
+
+        Returns:
+            List of example payloads declared in ``json_schema_extra``
+        """
+        return copy.deepcopy(list(cls._schema_examples()))
+
 
 class ToolInput(BaseModel):
     """Standardized LLM-friendly tool input schema.
@@ -18,13 +18,198 @@ Example:
 
 from __future__ import annotations
 
+import itertools
 import json
+import reprlib
+import weakref
+from functools import lru_cache
 from typing import Any, TypeVar
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PydanticUserError, ValidationError
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 T = TypeVar("T", bound=BaseModel)
 
+# Opt-in msgspec Struct mirrors keyed by model class (see ``register_msgspec``).
+_MSGSPEC_STRUCTS: weakref.WeakKeyDictionary[type[BaseModel], type[Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _PayloadRepr(reprlib.Repr):
+    """Bounded repr for payloads echoed in error messages.
+
+    Caps the size so a huge tool output cannot blow up the exception text,
+    but keeps dict insertion order (``reprlib`` sorts keys) so small payloads
+    read exactly as they were sent.
+    """
+
+    def repr_dict(self, x: dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in itertools.islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return "{" + ", ".join(pieces) + "}"
+
+
+_PAYLOAD_REPR = _PayloadRepr(
+    maxlevel=20,
+    maxdict=20,
+    maxlist=20,
+    maxtuple=20,
+    maxset=20,
+    maxstring=200,
+    maxother=200,
+)
+
+
+@lru_cache(maxsize=128)
+def _schema_json(schema: type[BaseModel]) -> str:
+    """Render ``schema``'s JSON Schema once per model class.
+
+    Compact separators keep the cached string (and every error message that
+    embeds it) small; ``default=str`` covers non-JSON defaults in the schema.
+    """
+    return json.dumps(schema.model_json_schema(), default=str, separators=(",", ":"))
+
+
+def _format_errors(error: ValueError) -> list[str]:
+    """Format a validation failure as indented bullet lines."""
+    if not isinstance(error, ValidationError):
+        return [f"  - {error}"]
+    return [
+        f"  - {' -> '.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in error.errors(include_url=False)
+    ]
+
+
+class _LazyValidationError(ValueError):
+    """ValueError whose diagnostic message is only rendered when read.
+
+    The message embeds the received payload and the model's JSON schema, which
+    is wasted work for callers that just catch the exception and move on.
+    ``args`` is ``(message,)`` like a plain ``ValueError(msg)``, rendered on
+    first access. Pickling carries only the rendered message, so local schema
+    classes and unpicklable payloads never reach the pickler.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        schema: type[BaseModel],
+        data: object,
+        error: ValueError,
+    ) -> None:
+        super().__init__()
+        self.kind = kind
+        self.schema = schema
+        self.data = data
+        self.error = error
+        self._message: str | None = None
+
+    @classmethod
+    def _from_message(cls, message: str) -> _LazyValidationError:
+        """Rebuild an unpickled error; only the rendered message survives."""
+        error = cls.__new__(cls)
+        error._message = message
+        return error
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        # Mirror BaseException.__str__ for reassigned args.
+        self._message = str(value[0]) if len(value) == 1 else str(tuple(value))
+
+    def __reduce__(self) -> tuple[Any, tuple[str]]:
+        return (type(self)._from_message, (str(self),))
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = "\n".join(
+                [
+                    (
+                        f"Tool {self.kind} validation failed for schema "
+                        f"'{self.schema.__name__}':"
+                    ),
+                    "",
+                    f"Received {self.kind}:",
+                    f"  {_PAYLOAD_REPR.repr(self.data)}",
+                    "",
+                    "Validation errors:",
+                    *_format_errors(self.error),
+                    "",
+                    "Expected schema:",
+                    f"  {self._render_schema()}",
+                ]
+            )
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def _render_schema(self) -> str:
+        """Render the expected schema; formatting the error must never fail."""
+        try:
+            return _schema_json(self.schema)
+        except (PydanticUserError, TypeError, ValueError) as e:
+            return f"<unavailable: {type(e).__name__}: {e}>"
+
+
+def register_msgspec(schema: type[BaseModel], struct: type[Any]) -> None:
+    """Validate ``schema`` payloads with a ``msgspec.Struct`` mirror instead.
+
+    ``validate_input`` and ``validate_output`` then check data with
+    ``msgspec.convert`` and build the model via ``model_construct``, skipping
+    pydantic validation. Only register structs whose fields and constraints
+    (``msgspec.Meta``) match the model exactly: pydantic validators, coercions
+    and nested models are *not* applied on this path, and nested structs are
+    passed through as-is, so flat models of builtin types are the best fit.
+
+    Args:
+        schema: Pydantic model class to accelerate
+        struct: ``msgspec.Struct`` subclass mirroring ``schema``'s fields
+
+    Raises:
+        ImportError: If msgspec is not installed
+        TypeError: If ``struct`` is not a ``msgspec.Struct`` subclass
+    """
+    if not MSGSPEC_AVAILABLE:
+        raise ImportError(
+            "msgspec is required for the msgspec validation backend. "
+            "Install it with: pip install msgspec"
+        )
+    if not (isinstance(struct, type) and issubclass(struct, msgspec.Struct)):
+        msg = f"Expected a msgspec.Struct subclass, got {struct!r}"
+        raise TypeError(msg)
+    _MSGSPEC_STRUCTS[schema] = struct
+
+
+def _validate[T: BaseModel](data: object, schema: type[T]) -> T:
+    """Validate ``data`` with the registered msgspec struct or pydantic."""
+    # The emptiness check skips the weakref lookup entirely on the default path;
+    # structs can only be registered when msgspec is installed.
+    struct = _MSGSPEC_STRUCTS.get(schema) if _MSGSPEC_STRUCTS else None
+    if struct is None:
+        validated: T = schema.__pydantic_validator__.validate_python(data)
+        return validated
+    converted = msgspec.convert(data, struct)
+    return schema.model_construct(**msgspec.structs.asdict(converted))
+
 
 def _reject_blank_strings(value: object, path: str = "input") -> None:
     """Raise on empty or whitespace-only strings anywhere in the payload."""
@@ -33,6 +218,9 @@ def _reject_blank_strings(value: object, path: str = "input") -> None:
             raise ValueError(f"{path} must not be blank or whitespace-only")
         return
 
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+
     if isinstance(value, dict):
         for key, item in value.items():
             _reject_blank_strings(item, f"{path}.{key}")
@@ -76,45 +264,73 @@ def validate_output[T: BaseModel](output: dict[str, Any], schema: type[T]) -> T:
         ...     print(f"Validation failed: {e}")
     """
     try:
-        return schema(**output)
-    except ValidationError as e:
-        # Create helpful error message with context
-        error_lines = [
-            f"Tool output validation failed for schema '{schema.__name__}':",
-            "",
-            "Received output:",
-            f"  {output}",
-            "",
-            "Validation errors:",
-        ]
+        return _validate(output, schema)
+    except ValueError as e:
+        raise _LazyValidationError("output", schema, output, e) from e
+
 
-        # Format each validation error
-        for error in e.errors():
-            loc = " -> ".join(str(part) for part in error["loc"])
-            error_lines.append(f"  - {loc}: {error['msg']}")
+def validate_output_trusted[T: BaseModel](output: dict[str, Any], schema: type[T]) -> T:
+    """Build a schema instance from output the server already validated.
 
-        # Add expected schema info
-        import json
+    Skips field validation entirely via ``model_construct``, so only use this
+    when every value in ``output`` came from validated models or trusted code.
+    Untrusted payloads must go through ``validate_output``. A cheap structural
+    check still rejects non-dict output and missing required fields.
+
+    Args:
+        output: Tool output assembled from already-validated data
+        schema: Pydantic model class to construct (e.g., ToolResponse)
+
+    Returns:
+        Schema instance built without validation
+
+    Raises:
+        ValueError: If output is not a dict or lacks required fields
 
-        error_lines.extend(
-            [
-                "",
-                "Expected schema:",
-                f"  {json.dumps(schema.model_json_schema(), indent=2)}",
-            ]
+    Example:
+        >>> validated_input = validate_input(raw_input, SearchInput)
+        >>> output = {"success": True, "message": f"Found {validated_input.query}"}
+        >>> response = validate_output_trusted(output, ToolResponse)
+    """
+    if type(output) is not dict:
+        msg = (
+            f"Trusted tool output for schema '{schema.__name__}' must be a dict, "
+            f"got {type(output).__name__}"
         )
+        raise ValueError(msg)
+
+    missing = [
+        name
+        for name, field in schema.model_fields.items()
+        if field.is_required() and name not in output and field.alias not in output
+    ]
+    if missing:
+        msg = (
+            f"Trusted tool output for schema '{schema.__name__}' is missing "
+            f"required fields: {', '.join(missing)}"
+        )
+        raise ValueError(msg)
 
-        raise ValueError("\n".join(error_lines)) from e
+    return schema.model_construct(**output)
 
 
-def validate_input[T: BaseModel](input_data: dict[str, Any], schema: type[T]) -> T:
+def validate_input[T: BaseModel](input_data: dict[str, Any] | T, schema: type[T]) -> T:
     """Validate tool input against a Pydantic schema.
 
     Similar to validate_output but for input validation. Use this when tools
     receive parameters that need validation before processing.
 
+    An instance of exactly ``schema`` skips pydantic re-validation, since
+    pydantic validated it when it was constructed, so pipelines that pass
+    models along don't pay for a second validation. Its field values still get
+    the blank-string check, which pydantic alone doesn't apply. This assumes
+    instances aren't mutated afterwards (use ``frozen=True`` or
+    ``validate_assignment=True`` to enforce that) or built with
+    ``model_construct``.
+
     Args:
-        input_data: Raw tool input as dictionary (from MCP protocol)
+        input_data: Raw tool input as dictionary (from MCP protocol), or an
+            already-validated ``schema`` instance
         schema: Pydantic model class to validate against
 
     Returns:
@@ -143,51 +359,16 @@ def validate_input[T: BaseModel](input_data: dict[str, Any], schema: type[T]) ->
     """
     try:
         _reject_blank_strings(input_data)
-        return schema(**input_data)
+        if type(input_data) is schema:  # exact class, not subclass
+            return input_data
+        return _validate(input_data, schema)
     except ValueError as e:
-        error_lines = [
-            f"Tool input validation failed for schema '{schema.__name__}':",
-            "",
-            "Received input:",
-            f"  {input_data}",
-            "",
-            "Validation errors:",
-            f"  - {e}",
-        ]
-
-        error_lines.extend(
-            [
-                "",
-                "Expected schema:",
-                f"  {json.dumps(schema.model_json_schema(), indent=2)}",
-            ]
-        )
-
-        raise ValueError("\n".join(error_lines)) from e
-    except ValidationError as e:
-        # Create helpful error message
-        error_lines = [
-            f"Tool input validation failed for schema '{schema.__name__}':",
-            "",
-            "Received input:",
-            f"  {input_data}",
-            "",
-            "Validation errors:",
-        ]
-
-        for error in e.errors():
-            loc = " -> ".join(str(part) for part in error["loc"])
-            error_lines.append(f"  - {loc}: {error['msg']}")
-
-        error_lines.extend(
-            [
-                "",
-                "Expected schema:",
-                f"  {json.dumps(schema.model_json_schema(), indent=2)}",
-            ]
-        )
-
-        raise ValueError("\n".join(error_lines)) from e
+        raise _LazyValidationError("input", schema, input_data, e) from e
 
 
-__all__ = ["validate_output", "validate_input"]
+__all__ = [
+    "register_msgspec",
+    "validate_input",
+    "validate_output",
+    "validate_output_trusted",
+]
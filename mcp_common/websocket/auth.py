@@ -8,7 +8,9 @@ checking for secure real-time connections.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -18,10 +20,28 @@ try:
     JWT_AVAILABLE = True
 except ImportError:
     JWT_AVAILABLE = False
+else:
+    # mcp_common.auth needs PyJWT itself; decode_token is only reachable with it.
+    from mcp_common.auth.exceptions import TokenExpiredError, TokenInvalidError
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_token(token: str, secret: str, algorithm: str) -> dict[str, Any]:
+    """Decode and verify ``token`` with PyJWT."""
+    payload: dict[str, Any] = jwt.decode(token, secret, algorithms=[algorithm])
+    return payload
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy decoded JSON (dicts/lists of scalars) faster than ``copy.deepcopy``."""
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
 class WebSocketAuthenticator:
     """Handles WebSocket connection authentication using JWT.
 
@@ -39,6 +59,7 @@ class WebSocketAuthenticator:
         secret: str,
         algorithm: str = "HS256",
         token_expiry: int = 3600,
+        verify_cache_size: int = 1024,
     ):
         """Initialize authenticator.
 
@@ -46,6 +67,8 @@ class WebSocketAuthenticator:
             secret: JWT secret key for signing tokens
             algorithm: JWT algorithm (default: HS256)
             token_expiry: Token expiry time in seconds (default: 1 hour)
+            verify_cache_size: Number of verified tokens to remember so repeat
+                verifications skip the signature check (0 disables caching)
 
         Raises:
             ImportError: If PyJWT is not installed
@@ -59,6 +82,33 @@ class WebSocketAuthenticator:
         self.secret = secret
         self.algorithm = algorithm
         self.token_expiry = token_expiry
+        # Only successful decodes are cached (exceptions are never stored), and
+        # the key includes secret/algorithm so changing either misses the cache.
+        self._cached_decode = (
+            lru_cache(maxsize=verify_cache_size)(_decode_token)
+            if verify_cache_size > 0
+            else None
+        )
+
+    def _verified_payload(self, token: str) -> dict[str, Any]:
+        """Return the verified payload, raising PyJWT's errors on failure."""
+        cached_decode = self._cached_decode
+        # Non-str tokens may be unhashable; let PyJWT reject them uncached.
+        if cached_decode is None or type(token) is not str:
+            return _decode_token(token, self.secret, self.algorithm)
+
+        payload = cached_decode(token, self.secret, self.algorithm)
+
+        # Cached payloads were verified earlier, so re-check expiry (with the
+        # same ``exp <= now`` rule as PyJWT) before handing them out again.
+        exp = payload.get("exp")
+        if exp is not None and int(exp) <= time.time():
+            raise ExpiredSignatureError("Signature has expired")
+
+        # Copy so callers mutating the result (e.g. its permissions list)
+        # can't alter the cached payload
+        copied: dict[str, Any] = _copy_json(payload)
+        return copied
 
     def create_token(self, payload: dict[str, Any]) -> str:
         """Create JWT token for WebSocket authentication.
@@ -80,14 +130,44 @@ class WebSocketAuthenticator:
         # Create a copy to avoid modifying the original
         token_payload = payload.copy()
 
-        # Add standard claims
-        token_payload["exp"] = datetime.now(UTC) + timedelta(seconds=self.token_expiry)
-        token_payload["iat"] = datetime.now(UTC)
+        # Add standard claims from a single clock read so exp - iat is exact
+        now = datetime.now(UTC)
+        token_payload["exp"] = now + timedelta(seconds=self.token_expiry)
+        token_payload["iat"] = now
 
         # Encode token
         token = jwt.encode(token_payload, self.secret, algorithm=self.algorithm)
         return token
 
+    def decode_token(self, token: str) -> dict[str, Any]:
+        """Verify JWT token and return payload, raising if it is not valid.
+
+        Use this instead of ``verify_token`` when the caller needs to know why
+        a token was rejected.
+
+        Args:
+            token: JWT token to verify
+
+        Returns:
+            Decoded payload dictionary
+
+        Raises:
+            TokenExpiredError: If the token has expired
+            TokenInvalidError: If the token is malformed or its signature fails
+
+        Example:
+            >>> try:
+            ...     payload = auth.decode_token(token)
+            ... except TokenExpiredError:
+            ...     print("Please log in again")
+        """
+        try:
+            return self._verified_payload(token)
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError("Token has expired") from e
+        except InvalidTokenError as e:
+            raise TokenInvalidError(str(e)) from e
+
     def verify_token(self, token: str) -> dict[str, Any] | None:
         """Verify JWT token and return payload.
 
@@ -107,8 +187,7 @@ class WebSocketAuthenticator:
             return None
 
         try:
-            payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
-            return payload
+            return self._verified_payload(token)
         except ExpiredSignatureError:
             logger.warning("Token expired")
             return None
@@ -160,6 +239,12 @@ class WebSocketAuthenticator:
         return payload
 
 
+@lru_cache(maxsize=8)
+def _test_authenticator(secret: str) -> WebSocketAuthenticator:
+    """Return a shared authenticator per secret for ``generate_test_token``."""
+    return WebSocketAuthenticator(secret=secret)
+
+
 def generate_test_token(
     user_id: str,
     permissions: list[str] | None = None,
@@ -178,7 +263,7 @@ def generate_test_token(
     Example:
         >>> token = generate_test_token("user123", ["read", "write"])
     """
-    return WebSocketAuthenticator(secret=secret).create_token(
+    return _test_authenticator(secret).create_token(
         {
             "user_id": user_id,
             "permissions": permissions or ["read"],
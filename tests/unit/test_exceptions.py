@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from mcp_common.exceptions import (
@@ -489,3 +491,18 @@ class TestExceptionAttributes:
         assert length_error.min_length == 10
         assert length_error.max_length == 100
         assert length_error.actual_length == 5
+
+    def test_configuration_error_attributes_survive_pickling(self) -> None:
+        """Test field/value round-trip through pickle (e.g. across worker processes)."""
+        error = CredentialValidationError(
+            message="password is too short",
+            field="password",
+            value="3 characters",
+        )
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is CredentialValidationError
+        assert str(restored) == "password is too short"
+        assert restored.field == "password"
+        assert restored.value == "3 characters"
@@ -2,13 +2,59 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any, Final
 
 import pytest
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from mcp_common.schemas import ToolInput, ToolResponse
 
+_SEARCH_USERS_PARAMS: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query (name or email)",
+        }
+    },
+    "required": ["query"],
+}
+_SEND_EMAIL_PARAMS: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "to": {"type": "string", "description": "Recipient email"},
+        "subject": {"type": "string", "description": "Email subject"},
+    },
+    "required": ["to", "subject"],
+}
+_ADVANCED_SEARCH_PARAMS: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "filters": {
+            "type": "object",
+            "properties": {
+                "date_range": {"type": "string"},
+                "category": {"type": "string"},
+            },
+        },
+        "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+    },
+    "required": ["query"],
+}
+_EMPTY_OBJECT_PARAMS: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+
+def _error_fields(exc: ValidationError) -> set[str | int]:
+    """Collect top-level error locations without rendering URLs/context/input."""
+    errors = exc.errors(include_url=False, include_context=False, include_input=False)
+    return {e["loc"][0] for e in errors}
+
 
 @pytest.mark.unit
 class TestToolResponse:
@@ -99,9 +145,7 @@ class TestToolResponse:
         with pytest.raises(ValidationError) as exc_info:
             ToolResponse(success=True)  # Missing message
 
-        errors = exc_info.value.errors()
-        error_fields = {e["loc"][0] for e in errors}
-        assert "message" in error_fields
+        assert "message" in _error_fields(exc_info.value)
 
     def test_tool_response_invalid_success_type(self) -> None:
         """Test that success must be boolean."""
@@ -111,22 +155,35 @@ class TestToolResponse:
                 message="Test",
             )
 
-        errors = exc_info.value.errors()
-        assert any(e["loc"][0] == "success" for e in errors)
+        assert "success" in _error_fields(exc_info.value)
 
     def test_tool_response_to_dict(self) -> None:
-        """Test ToolResponse can be converted to dict."""
+        """Test ToolResponse exposes its fields as attributes."""
         response = ToolResponse(
             success=True,
             message="Test",
             data={"key": "value"},
         )
 
-        response_dict = response.model_dump()
+        assert response.success is True
+        assert response.message == "Test"
+        assert response.data == {"key": "value"}
 
-        assert response_dict["success"] is True
-        assert response_dict["message"] == "Test"
-        assert response_dict["data"]["key"] == "value"
+    def test_model_dump_shape(self) -> None:
+        """Test ToolResponse can be converted to dict."""
+        response = ToolResponse(
+            success=True,
+            message="Test",
+            data={"key": "value"},
+        )
+
+        assert response.model_dump() == {
+            "success": True,
+            "message": "Test",
+            "data": {"key": "value"},
+            "error": None,
+            "next_steps": None,
+        }
 
     def test_tool_response_to_json(self) -> None:
         """Test ToolResponse can be serialized to JSON."""
@@ -136,9 +193,7 @@ class TestToolResponse:
             data={"count": 5},
         )
 
-        json_str = response.model_dump_json()
-
-        parsed = json.loads(json_str)
+        parsed = from_json(response.model_dump_json())
         assert parsed["success"] is True
         assert parsed["data"]["count"] == 5
 
@@ -179,7 +234,7 @@ class TestToolResponseExamples:
 
     def test_example_1_success_case(self) -> None:
         """Test first example: successful user creation."""
-        example = ToolResponse.model_json_schema()["examples"][0]
+        example = ToolResponse.cached_examples()[0]
 
         response = ToolResponse(**example)
 
@@ -189,7 +244,7 @@ class TestToolResponseExamples:
 
     def test_example_2_failure_case(self) -> None:
         """Test second example: database connection failure."""
-        example = ToolResponse.model_json_schema()["examples"][1]
+        example = ToolResponse.cached_examples()[1]
 
         response = ToolResponse(**example)
 
@@ -197,6 +252,22 @@ class TestToolResponseExamples:
         assert "Failed to connect" in response.message
         assert response.error is not None
 
+    def test_cached_examples_match_json_schema(self) -> None:
+        """Test cached examples mirror the schema and are memoized."""
+        examples = ToolResponse.cached_examples()
+
+        assert examples == ToolResponse.model_json_schema()["examples"]
+
+    def test_cached_examples_are_isolated_from_mutation(self) -> None:
+        """Test mutating the returned examples does not corrupt the cache."""
+        examples = ToolResponse.cached_examples()
+        expected = ToolResponse.model_json_schema()["examples"]
+
+        examples[0]["data"]["injected"] = True
+        examples.pop()
+
+        assert ToolResponse.cached_examples() == expected
+
 
 @pytest.mark.unit
 class TestToolInput:
@@ -207,16 +278,7 @@ class TestToolInput:
         tool_input = ToolInput(
             name="search_users",
             description="Search for users by name or email",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (name or email)",
-                    }
-                },
-                "required": ["query"],
-            },
+            parameters=_SEARCH_USERS_PARAMS,
             example={"query": "alice@example.com"},
         )
 
@@ -228,14 +290,7 @@ class TestToolInput:
         tool_input = ToolInput(
             name="send_email",
             description="Send transactional email",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "to": {"type": "string", "description": "Recipient email"},
-                    "subject": {"type": "string", "description": "Email subject"},
-                },
-                "required": ["to", "subject"],
-            },
+            parameters=_SEND_EMAIL_PARAMS,
             example={"to": "user@example.com", "subject": "Test Email"},
         )
 
@@ -251,21 +306,7 @@ class TestToolInput:
         tool_input = ToolInput(
             name="advanced_search",
             description="Advanced search with filters",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"},
-                    "filters": {
-                        "type": "object",
-                        "properties": {
-                            "date_range": {"type": "string"},
-                            "category": {"type": "string"},
-                        },
-                    },
-                    "limit": {"type": "integer", "minimum": 1, "maximum": 100},
-                },
-                "required": ["query"],
-            },
+            parameters=_ADVANCED_SEARCH_PARAMS,
             example={"query": "test", "limit": 10},
         )
 
@@ -279,8 +320,7 @@ class TestToolInput:
                 # Missing description, parameters, example
             )
 
-        errors = exc_info.value.errors()
-        error_fields = {e["loc"][0] for e in errors}
+        error_fields = _error_fields(exc_info.value)
         assert "description" in error_fields
         assert "parameters" in error_fields
         assert "example" in error_fields
@@ -290,7 +330,7 @@ class TestToolInput:
         tool_input = ToolInput(
             name="get_user_profile",
             description="Get user profile",
-            parameters={"type": "object", "properties": {}, "required": []},
+            parameters=_EMPTY_OBJECT_PARAMS,
             example={},
         )
 
@@ -319,11 +359,7 @@ class TestToolResponseEncoding:
         tool_input = ToolInput(
             name="test",
             description="Test",
-            parameters={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
+            parameters=_EMPTY_OBJECT_PARAMS,
             example={"tags": {1, 2, 3}},
         )
 
@@ -359,8 +395,9 @@ class TestToolResponseValidation:
 
     def test_optional_fields_can_be_omitted(self) -> None:
         """Test that optional fields can be None or omitted."""
-        # All valid
-        ToolResponse(
+        # Omission is covered by test_tool_response_success_basic; this checks
+        # that validation accepts explicit None values.
+        response = ToolResponse(
             success=True,
             message="Test",
             data=None,
@@ -368,6 +405,10 @@ class TestToolResponseValidation:
             next_steps=None,
         )
 
+        assert response.data is None
+        assert response.error is None
+        assert response.next_steps is None
+
     def test_next_steps_must_be_list(self) -> None:
         """Test next_steps must be a list of strings."""
         # Valid list
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import typing as t
 from datetime import UTC, datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
-from mcp_common.ui import ServerPanels
+from mcp_common.ui import ServerPanels, panels
+
+_FROZEN_TS = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+_LONG_TEXT = "A" * 1000
+_UNICODE_FEATURES = ("功能 1", "機能 2")  # Chinese, Japanese
+
+
+@pytest.fixture
+def mock_console(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Swap the shared panels console for a Mock that only exposes ``print``."""
+    console = Mock(spec=["print"])
+    monkeypatch.setattr(panels, "console", console)
+    return console
 
 
 @pytest.mark.unit
 class TestServerPanelsStartupSuccess:
     """Tests for startup_success panel."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_basic(self, mock_console: Mock) -> None:
         """Test basic startup success panel."""
         ServerPanels.startup_success(server_name="Test Server")
@@ -23,7 +35,6 @@ class TestServerPanelsStartupSuccess:
         call_args = mock_console.print.call_args
         assert call_args is not None
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_with_version(self, mock_console: Mock) -> None:
         """Test startup success with version."""
         ServerPanels.startup_success(
@@ -33,7 +44,6 @@ class TestServerPanelsStartupSuccess:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_with_features(self, mock_console: Mock) -> None:
         """Test startup success with features list."""
         ServerPanels.startup_success(
@@ -43,7 +53,6 @@ class TestServerPanelsStartupSuccess:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_with_endpoint(self, mock_console: Mock) -> None:
         """Test startup success with endpoint."""
         ServerPanels.startup_success(
@@ -53,7 +62,6 @@ class TestServerPanelsStartupSuccess:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_with_metadata(self, mock_console: Mock) -> None:
         """Test startup success with custom metadata."""
         ServerPanels.startup_success(
@@ -67,7 +75,6 @@ class TestServerPanelsStartupSuccess:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_startup_success_includes_timestamp(self, mock_console: Mock) -> None:
         """Test startup success includes timestamp."""
         ServerPanels.startup_success(server_name="Test Server")
@@ -85,7 +92,6 @@ class TestServerPanelsStartupSuccess:
 class TestServerPanelsError:
     """Tests for error panel."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_error_basic(self, mock_console: Mock) -> None:
         """Test basic error panel."""
         ServerPanels.error(
@@ -95,7 +101,6 @@ class TestServerPanelsError:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_error_with_suggestion(self, mock_console: Mock) -> None:
         """Test error panel with suggestion."""
         ServerPanels.error(
@@ -106,7 +111,6 @@ class TestServerPanelsError:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_error_with_type(self, mock_console: Mock) -> None:
         """Test error panel with error type."""
         ServerPanels.error(
@@ -117,7 +121,6 @@ class TestServerPanelsError:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_error_full(self, mock_console: Mock) -> None:
         """Test error panel with all fields."""
         ServerPanels.error(
@@ -134,7 +137,6 @@ class TestServerPanelsError:
 class TestServerPanelsWarning:
     """Tests for warning panel."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_warning_basic(self, mock_console: Mock) -> None:
         """Test basic warning panel."""
         ServerPanels.warning(
@@ -144,7 +146,6 @@ class TestServerPanelsWarning:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_warning_with_details(self, mock_console: Mock) -> None:
         """Test warning panel with details."""
         ServerPanels.warning(
@@ -164,7 +165,6 @@ class TestServerPanelsWarning:
 class TestServerPanelsInfo:
     """Tests for info panel."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_info_basic(self, mock_console: Mock) -> None:
         """Test basic info panel."""
         ServerPanels.info(
@@ -174,7 +174,6 @@ class TestServerPanelsInfo:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_info_with_items(self, mock_console: Mock) -> None:
         """Test info panel with items."""
         ServerPanels.info(
@@ -195,7 +194,6 @@ class TestServerPanelsInfo:
 class TestServerPanelsStatusTable:
     """Tests for status_table display."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_status_table_basic(self, mock_console: Mock) -> None:
         """Test basic status table."""
         ServerPanels.status_table(
@@ -209,7 +207,6 @@ class TestServerPanelsStatusTable:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_status_table_custom_headers(self, mock_console: Mock) -> None:
         """Test status table with custom headers."""
         ServerPanels.status_table(
@@ -223,7 +220,6 @@ class TestServerPanelsStatusTable:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_status_table_colorization(self, mock_console: Mock) -> None:
         """Test status table colorizes status column."""
         ServerPanels.status_table(
@@ -238,7 +234,6 @@ class TestServerPanelsStatusTable:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_status_table_keyword_colorization(self, mock_console: Mock) -> None:
         """Test status table colorizes based on keywords."""
         ServerPanels.status_table(
@@ -259,7 +254,6 @@ class TestServerPanelsStatusTable:
 class TestServerPanelsFeatureList:
     """Tests for feature_list display."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_feature_list_basic(self, mock_console: Mock) -> None:
         """Test basic feature list."""
         ServerPanels.feature_list(
@@ -274,11 +268,28 @@ class TestServerPanelsFeatureList:
         mock_console.print.assert_called_once()
 
 
+class Backup:
+    """Attribute-style backup record for backups_table tests."""
+
+    def __init__(
+        self,
+        backup_id: str,
+        name: str,
+        profile: str,
+        created_at: datetime,
+        description: str,
+    ) -> None:
+        self.id = backup_id
+        self.name = name
+        self.profile = profile
+        self.created_at = created_at
+        self.description = description
+
+
 @pytest.mark.unit
 class TestServerPanelsGenericHelpers:
     """Tests for generic helper methods."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_config_table(self, mock_console: Mock) -> None:
         """Test config_table helper."""
         ServerPanels.config_table(
@@ -293,7 +304,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_simple_table(self, mock_console: Mock) -> None:
         """Test simple_table helper."""
         ServerPanels.simple_table(
@@ -308,7 +318,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_simple_table_custom_border(self, mock_console: Mock) -> None:
         """Test simple_table with custom border style."""
         ServerPanels.simple_table(
@@ -320,7 +329,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_process_list_from_dicts(self, mock_console: Mock) -> None:
         """Test process_list with dict-like objects."""
         processes = [
@@ -332,7 +340,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_process_list_from_tuples(self, mock_console: Mock) -> None:
         """Test process_list with tuple data."""
         processes = [
@@ -344,7 +351,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_process_list_custom_headers(self, mock_console: Mock) -> None:
         """Test process_list with custom headers."""
         processes = [
@@ -359,7 +365,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_status_panel(self, mock_console: Mock) -> None:
         """Test status_panel helper."""
         ServerPanels.status_panel(
@@ -376,43 +381,27 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
-    def test_status_panel_severity_colors(self, mock_console: Mock) -> None:
+    @pytest.mark.parametrize("severity", ["success", "warning", "error", "info"])
+    def test_status_panel_severity_colors(
+        self, mock_console: Mock, severity: str
+    ) -> None:
         """Test status_panel with different severities."""
-        for severity in ["success", "warning", "error", "info"]:
-            ServerPanels.status_panel(
-                title=f"Test {severity}",
-                status_text=f"{severity} message",
-                severity=severity,
-            )
+        ServerPanels.status_panel(
+            title=f"Test {severity}",
+            status_text=f"{severity} message",
+            severity=severity,
+        )
 
-        assert mock_console.print.call_count == 4
+        mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_backups_table_with_objects(self, mock_console: Mock) -> None:
         """Test backups_table with backup objects."""
-
-        class Backup:
-            def __init__(
-                self,
-                backup_id: str,
-                name: str,
-                profile: str,
-                created_at: datetime,
-                description: str,
-            ) -> None:
-                self.id = backup_id
-                self.name = name
-                self.profile = profile
-                self.created_at = created_at
-                self.description = description
-
         backups = [
             Backup(
                 backup_id="abc123def456",
                 name="Backup 1",
                 profile="production",
-                created_at=datetime.now(UTC),
+                created_at=_FROZEN_TS,
                 description="Daily backup",
             )
         ]
@@ -421,7 +410,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_backups_table_with_dicts(self, mock_console: Mock) -> None:
         """Test backups_table with dict objects."""
         backups = [
@@ -438,14 +426,12 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_backups_table_empty(self, mock_console: Mock) -> None:
         """Test backups_table with empty list."""
         ServerPanels.backups_table(backups=[])
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_server_status_table(self, mock_console: Mock) -> None:
         """Test server_status_table helper."""
         ServerPanels.server_status_table(
@@ -458,7 +444,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_server_status_table_with_markup_status(self, mock_console: Mock) -> None:
         """Test server_status_table preserves explicit Rich markup."""
         ServerPanels.server_status_table(
@@ -469,7 +454,6 @@ class TestServerPanelsGenericHelpers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_server_status_table_without_status_column(self, mock_console: Mock) -> None:
         """Test server_status_table leaves single-cell rows untouched."""
         ServerPanels.server_status_table(
@@ -485,7 +469,6 @@ class TestServerPanelsGenericHelpers:
 class TestServerPanelsConvenienceWrappers:
     """Tests for convenience wrapper methods."""
 
-    @patch("mcp_common.ui.panels.console")
     def test_endpoint_panel(self, mock_console: Mock) -> None:
         """Test endpoint_panel convenience wrapper."""
         ServerPanels.endpoint_panel(
@@ -495,7 +478,6 @@ class TestServerPanelsConvenienceWrappers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_endpoint_panel_with_extras(self, mock_console: Mock) -> None:
         """Test endpoint_panel with extra metadata."""
         ServerPanels.endpoint_panel(
@@ -509,7 +491,6 @@ class TestServerPanelsConvenienceWrappers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_warning_panel(self, mock_console: Mock) -> None:
         """Test warning_panel convenience wrapper."""
         ServerPanels.warning_panel(
@@ -524,30 +505,30 @@ class TestServerPanelsConvenienceWrappers:
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_simple_message(self, mock_console: Mock) -> None:
         """Test simple_message helper."""
         ServerPanels.simple_message("Server ready", style="green bold")
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
-    def test_simple_message_multiple_styles(self, mock_console: Mock) -> None:
+    @pytest.mark.parametrize(
+        ("message", "style"),
+        [("Success", "green"), ("Warning", "yellow"), ("Error", "red")],
+    )
+    def test_simple_message_multiple_styles(
+        self, mock_console: Mock, message: str, style: str
+    ) -> None:
         """Test simple_message with different styles."""
-        ServerPanels.simple_message("Success", style="green")
-        ServerPanels.simple_message("Warning", style="yellow")
-        ServerPanels.simple_message("Error", style="red")
+        ServerPanels.simple_message(message, style=style)
 
-        assert mock_console.print.call_count == 3
+        mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_separator(self, mock_console: Mock) -> None:
         """Test separator helper."""
         ServerPanels.separator()
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_separator_custom(self, mock_console: Mock) -> None:
         """Test separator with custom character and count."""
         ServerPanels.separator(char="=", count=60)
@@ -559,66 +540,57 @@ class TestServerPanelsConvenienceWrappers:
 class TestServerPanelsEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @patch("mcp_common.ui.panels.console")
-    def test_empty_features_list(self, mock_console: Mock) -> None:
-        """Test startup_success with empty features."""
-        ServerPanels.startup_success(
-            server_name="Test Server",
-            features=[],
-        )
+    @pytest.mark.parametrize(
+        ("render", "kwargs"),
+        [
+            pytest.param(
+                ServerPanels.startup_success,
+                {"server_name": "Test Server", "features": []},
+                id="empty_features_list",
+            ),
+            pytest.param(
+                ServerPanels.startup_success,
+                {"server_name": "Test Server"},
+                id="empty_metadata",
+            ),
+            pytest.param(
+                ServerPanels.info,
+                {"title": "Info", "message": "Test message", "items": {}},
+                id="empty_items_dict",
+            ),
+            pytest.param(
+                ServerPanels.status_table,
+                {"title": "Empty Table", "rows": []},
+                id="empty_rows",
+            ),
+        ],
+    )
+    def test_empty_inputs(
+        self,
+        mock_console: Mock,
+        render: t.Callable[..., None],
+        kwargs: dict[str, t.Any],
+    ) -> None:
+        """Test panels render a single output for empty optional inputs."""
+        render(**kwargs)
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
-    def test_empty_metadata(self, mock_console: Mock) -> None:
-        """Test startup_success with empty metadata."""
-        ServerPanels.startup_success(
-            server_name="Test Server",
-            **{},
-        )
-
-        mock_console.print.assert_called_once()
-
-    @patch("mcp_common.ui.panels.console")
-    def test_empty_items_dict(self, mock_console: Mock) -> None:
-        """Test info panel with empty items."""
-        ServerPanels.info(
-            title="Info",
-            message="Test message",
-            items={},
-        )
-
-        mock_console.print.assert_called_once()
-
-    @patch("mcp_common.ui.panels.console")
-    def test_empty_rows(self, mock_console: Mock) -> None:
-        """Test status_table with empty rows."""
-        ServerPanels.status_table(
-            title="Empty Table",
-            rows=[],
-        )
-
-        mock_console.print.assert_called_once()
-
-    @patch("mcp_common.ui.panels.console")
     def test_unicode_in_messages(self, mock_console: Mock) -> None:
         """Test panels handle unicode characters."""
         ServerPanels.startup_success(
             server_name="Тестовый Сервер",  # Russian
-            features=["功能 1", "機能 2"],  # Chinese, Japanese
+            features=list(_UNICODE_FEATURES),
         )
 
         mock_console.print.assert_called_once()
 
-    @patch("mcp_common.ui.panels.console")
     def test_very_long_strings(self, mock_console: Mock) -> None:
         """Test panels handle very long strings."""
-        long_text = "A" * 1000
-
         ServerPanels.info(
             title="Long Text Test",
-            message=long_text,
-            items={"key": long_text},
+            message=_LONG_TEXT,
+            items={"key": _LONG_TEXT},
         )
 
         mock_console.print.assert_called_once()
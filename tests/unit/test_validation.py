@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import json
+import pickle
+import threading
+import weakref
+from typing import Annotated, Any
 
 import pytest
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from mcp_common import validation
 from mcp_common.schemas import ToolResponse
-from mcp_common.validation import validate_input, validate_output
+from mcp_common.validation import (
+    register_msgspec,
+    validate_input,
+    validate_output,
+    validate_output_trusted,
+)
 
 
 # Test Models
@@ -130,8 +140,11 @@ class TestValidateOutput:
 
         error_msg = str(exc_info.value)
         assert "Expected schema:" in error_msg
-        # Schema should be JSON
-        assert "{" in error_msg
+        # Schema should be compact JSON
+        assert (
+            json.dumps(ToolResponse.model_json_schema(), separators=(",", ":"))
+            in error_msg
+        )
 
     def test_validate_output_with_custom_model(self) -> None:
         """Test validate_output with custom Pydantic model."""
@@ -252,6 +265,32 @@ class TestValidateInput:
         validated = validate_input({"name": "Elder", "age": 150}, SimpleInput)
         assert validated.age == 150
 
+    def test_validate_input_uses_rebuilt_validator(self) -> None:
+        """Test validation follows the model's validator after a rebuild."""
+
+        class Rebuilt(BaseModel):
+            x: int
+
+        validate_input({"x": 1}, Rebuilt)
+
+        Rebuilt.model_fields["x"].annotation = str
+        Rebuilt.model_rebuild(force=True)
+
+        assert validate_input({"x": "a"}, Rebuilt).x == "a"
+
+    def test_validate_input_returns_validated_instance_unchanged(self) -> None:
+        """Test an instance of the schema skips re-validation."""
+        instance = SimpleInput(name="Alice", age=30)
+
+        assert validate_input(instance, SimpleInput) is instance
+
+    def test_validate_input_rejects_blank_strings_in_instance(self) -> None:
+        """Test instances still get the blank-string check pydantic skips."""
+        instance = SimpleInput(name=" ", age=30)
+
+        with pytest.raises(ValueError, match=r"input\.name must not be blank"):
+            validate_input(instance, SimpleInput)
+
     def test_validate_input_string_constraints(self) -> None:
         """Test validation with string constraints."""
         # Empty string should fail
@@ -284,11 +323,23 @@ class TestValidationIntegration:
             "data": {"query": validated_input.query, "count": validated_input.limit},
         }
 
-        # Output validation
-        validated_output = validate_output(output_data, ToolResponse)
+        # Output built from validated input can skip re-validation
+        validated_output = validate_output_trusted(output_data, ToolResponse)
 
+        assert isinstance(validated_output, ToolResponse)
         assert validated_output.success is True
         assert "20 results" in validated_output.message
+        assert validated_output.next_steps is None  # defaults still applied
+
+    def test_trusted_output_rejects_missing_required_fields(self) -> None:
+        """Test trusted construction still checks required fields are present."""
+        with pytest.raises(ValueError, match="missing required fields: message"):
+            validate_output_trusted({"success": True}, ToolResponse)
+
+    def test_trusted_output_rejects_non_dict(self) -> None:
+        """Test trusted construction rejects non-dict output."""
+        with pytest.raises(ValueError, match="must be a dict"):
+            validate_output_trusted([("success", True)], ToolResponse)  # type: ignore[arg-type]
 
     def test_validation_in_tool_context(self) -> None:
         """Test validation as used in MCP tool context."""
@@ -405,3 +456,173 @@ class TestValidationEdgeCases:
         assert any("validation failed" in line.lower() for line in lines)
         assert any("Received output:" in line for line in lines)
         assert any("Validation errors:" in line for line in lines)
+
+    def test_validate_output_error_message_truncates_large_output(self) -> None:
+        """Test large received payloads are abbreviated in the error message."""
+        output = {f"key_{i}": "x" * 1000 for i in range(100)}
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_output(output, ToolResponse)
+
+        error_msg = str(exc_info.value)
+        assert "key_0" in error_msg
+        assert "key_99" not in error_msg
+        assert "x" * 1000 not in error_msg
+        # The full payload stays on the exception for debugging.
+        assert getattr(exc_info.value, "data", None) is output
+
+    def test_validate_output_error_message_echoes_small_payload_verbatim(
+        self,
+    ) -> None:
+        """Test small nested payloads keep their key order and full depth."""
+        output = {
+            "success": "invalid",
+            "message": "Done",
+            "data": {"z": {"y": {"x": {"w": {"v": {"u": [1, {"t": "deep"}]}}}}}},
+        }
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_output(output, ToolResponse)
+
+        assert f"  {output!r}" in str(exc_info.value).splitlines()
+
+    def test_validation_error_round_trips_through_pickle(self) -> None:
+        """Test the lazy error keeps ValueError's args, repr and pickle support."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_output({"success": "invalid"}, ToolResponse)
+
+        error = exc_info.value
+        assert error.args == (str(error),)
+        assert error.args[0].startswith("Tool output validation failed")
+        assert repr(error).startswith(f"{type(error).__name__}('Tool output")
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+        assert str(restored) == str(error)
+
+    def test_validation_error_pickles_local_schema_and_unpicklable_payload(
+        self,
+    ) -> None:
+        """Test pickling never touches the schema class or the received payload."""
+
+        class LocalInput(BaseModel):
+            name: str
+
+        payload = {"name": 1, "lock": threading.Lock()}
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_input(payload, LocalInput)
+
+        restored = pickle.loads(pickle.dumps(exc_info.value))
+
+        assert str(restored) == str(exc_info.value)
+        assert "LocalInput" in restored.args[0]
+
+    def test_validation_error_message_survives_unrenderable_schema(self) -> None:
+        """Test str() still works when the model has no JSON schema."""
+
+        class Opaque:
+            pass
+
+        class OpaqueOutput(BaseModel):
+            model_config = ConfigDict(arbitrary_types_allowed=True)
+
+            value: Opaque
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_output({"value": 1}, OpaqueOutput)
+
+        error_msg = str(exc_info.value)
+        assert "Tool output validation failed for schema 'OpaqueOutput'" in error_msg
+        assert "<unavailable: PydanticInvalidForJsonSchema" in error_msg
+
+    def test_validate_output_error_message_is_lazy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the schema is only rendered when the message is read."""
+        rendered: list[type[BaseModel]] = []
+
+        def fake_schema_json(schema: type[BaseModel]) -> str:
+            rendered.append(schema)
+            return "{}"
+
+        monkeypatch.setattr(validation, "_schema_json", fake_schema_json)
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_output({"success": "invalid"}, ToolResponse)
+
+        assert rendered == []
+        assert isinstance(exc_info.value.__cause__, ValidationError)
+
+        assert str(exc_info.value) == str(exc_info.value)
+        assert rendered == [ToolResponse]
+
+
+@pytest.fixture
+def msgspec_registry(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Give each test an empty msgspec registry; skip if msgspec is missing."""
+    msgspec = pytest.importorskip("msgspec")
+    monkeypatch.setattr(validation, "_MSGSPEC_STRUCTS", weakref.WeakKeyDictionary())
+    return msgspec
+
+
+@pytest.mark.unit
+class TestMsgspecBackend:
+    """Tests for the optional msgspec validation backend."""
+
+    def test_register_requires_msgspec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test registering without msgspec installed raises ImportError."""
+        monkeypatch.setattr(validation, "MSGSPEC_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="msgspec is required"):
+            register_msgspec(SimpleInput, object)
+
+    def test_register_rejects_non_struct(self, msgspec_registry: Any) -> None:
+        """Test only msgspec.Struct subclasses can be registered."""
+        with pytest.raises(TypeError, match="msgspec.Struct"):
+            register_msgspec(SimpleInput, dict)
+
+    def test_registered_input_uses_struct(self, msgspec_registry: Any) -> None:
+        """Test registered schemas are checked by msgspec and built as models."""
+        msgspec = msgspec_registry
+        name_type = Annotated[str, msgspec.Meta(min_length=1)]
+        age_type = Annotated[int, msgspec.Meta(ge=0, le=150)]
+        struct = msgspec.defstruct(
+            "SimpleInputStruct", [("name", name_type), ("age", age_type)]
+        )
+        register_msgspec(SimpleInput, struct)
+
+        validated = validate_input({"name": "Alice", "age": 30}, SimpleInput)
+
+        assert type(validated) is SimpleInput
+        assert validated.model_dump() == {"name": "Alice", "age": 30}
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_input({"name": "Alice", "age": 200}, SimpleInput)
+
+        assert isinstance(exc_info.value.__cause__, msgspec.ValidationError)
+        assert "Tool input validation failed" in str(exc_info.value)
+
+    def test_registered_output_uses_struct(self, msgspec_registry: Any) -> None:
+        """Test validate_output routes registered schemas through msgspec."""
+        msgspec = msgspec_registry
+        struct = msgspec.defstruct(
+            "NestedOutputStruct",
+            [
+                ("success", bool),
+                ("data", dict[str, int]),
+                ("metadata", dict[str, str] | None, None),
+            ],
+        )
+        register_msgspec(NestedOutput, struct)
+
+        validated = validate_output({"success": True, "data": {"n": 1}}, NestedOutput)
+
+        assert validated == NestedOutput(success=True, data={"n": 1})
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_output({"success": True, "data": {"n": "x"}}, NestedOutput)
+
+        assert isinstance(exc_info.value.__cause__, msgspec.ValidationError)
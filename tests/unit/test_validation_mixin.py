@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
-import importlib
-from unittest.mock import Mock
+import typing as t
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from mcp_common.config import ValidationMixin
 from mcp_common.config.validation_mixin import ValidationMixin as VM
+from mcp_common.config.validation_mixin import _raise_valueerror
 from mcp_common.exceptions import (
     CredentialValidationError,
     ServerConfigurationError,
 )
 
 
+# Test Models (built once at import; each class definition is a schema build)
+class _EmptyMixinModel(BaseModel, ValidationMixin):
+    """Field-less model for exercising mixin methods."""
+
+
+class ServerSettings(BaseModel, ValidationMixin):
+    """Server settings model for integration tests."""
+
+    username: str
+    password: str
+    host: str
+    port: int | None = None
+
+
+class AppConfig(BaseModel, ValidationMixin):
+    """App config model for integration tests."""
+
+    api_key: str
+    api_secret: str
+    endpoint: str
+
+
 @pytest.mark.unit
 class TestValidationMixinRequiredField:
     """Tests for validate_required_field method."""
@@ -60,7 +82,8 @@ class TestValidationMixinRequiredField:
         """Test fallback to ValueError when exceptions unavailable."""
         # Force exceptions to be unavailable
         monkeypatch.setattr(
-            "mcp_common.config.validation_mixin.EXCEPTIONS_AVAILABLE", False
+            "mcp_common.config.validation_mixin._raise_config_error",
+            _raise_valueerror,
         )
 
         with pytest.raises(ValueError) as exc_info:
@@ -107,10 +130,7 @@ class TestValidationMixinCredentials:
 
     def test_valid_credentials_pass(self) -> None:
         """Test validation with valid username and password."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
         model.validate_credentials(
             username="testuser",
             password="securepassword123",
@@ -118,10 +138,7 @@ class TestValidationMixinCredentials:
 
     def test_missing_username_fails(self) -> None:
         """Test validation fails when username is missing."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
 
         with pytest.raises(CredentialValidationError) as exc_info:
             model.validate_credentials(username=None, password="password123")
@@ -130,10 +147,7 @@ class TestValidationMixinCredentials:
 
     def test_missing_password_fails(self) -> None:
         """Test validation fails when password is missing."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
 
         with pytest.raises(CredentialValidationError) as exc_info:
             model.validate_credentials(username="testuser", password=None)
@@ -142,10 +156,7 @@ class TestValidationMixinCredentials:
 
     def test_short_password_fails(self) -> None:
         """Test validation fails when password is too short."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
 
         with pytest.raises(CredentialValidationError) as exc_info:
             model.validate_credentials(
@@ -158,10 +169,7 @@ class TestValidationMixinCredentials:
 
     def test_custom_min_password_length(self) -> None:
         """Test validation with custom minimum password length."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
 
         # Should pass with 8 chars
         model.validate_credentials(
@@ -180,10 +188,7 @@ class TestValidationMixinCredentials:
 
     def test_with_context(self) -> None:
         """Test validation includes context in error message."""
-        class TestModel(BaseModel, ValidationMixin):
-            pass
-
-        model = TestModel()
+        model = _EmptyMixinModel()
 
         with pytest.raises(CredentialValidationError) as exc_info:
             model.validate_credentials(
@@ -246,6 +251,11 @@ class TestValidationMixinURLParts:
             # incompatible argument below.
             VM.validate_url_parts(host="localhost", port="8080")  # type: ignore[arg-type]  # ty: ignore[invalid-argument-type]
 
+    def test_port_bool_fails(self) -> None:
+        """Test validation rejects bools even though bool subclasses int."""
+        with pytest.raises(ServerConfigurationError):
+            VM.validate_url_parts(host="localhost", port=True)
+
     def test_none_port_passes(self) -> None:
         """Test validation passes with None port (optional)."""
         VM.validate_url_parts(host="localhost", port=None)
@@ -300,6 +310,14 @@ class TestValidationMixinOneOfRequired:
                 values=["  ", "  "],
             )
 
+    @pytest.mark.parametrize("value", [0, False, [], {}])
+    def test_falsy_non_string_counts_as_set(self, value: t.Any) -> None:
+        """Test non-string values count as set even when falsy."""
+        VM.validate_one_of_required(
+            field_names=["field1", "field2"],
+            values=[None, value],
+        )
+
     def test_with_context(self) -> None:
         """Test validation includes context in error message."""
         with pytest.raises(ServerConfigurationError) as exc_info:
@@ -321,6 +339,14 @@ class TestValidationMixinOneOfRequired:
                 values=["value1"],
             )
 
+    def test_mismatched_lengths_checked_before_values(self) -> None:
+        """Test a mismatch is reported even when the first value is set."""
+        with pytest.raises(ValueError, match="field_names and values must have same length"):
+            VM.validate_one_of_required(
+                field_names=["field1"],
+                values=["value1", "value2"],
+            )
+
 
 @pytest.mark.unit
 class TestValidationMixinIntegration:
@@ -328,13 +354,6 @@ class TestValidationMixinIntegration:
 
     def test_model_with_validation_mixin(self) -> None:
         """Test ValidationMixin works with Pydantic models."""
-
-        class ServerSettings(BaseModel, ValidationMixin):
-            username: str
-            password: str
-            host: str
-            port: int | None = None
-
         settings = ServerSettings(
             username="admin",
             password="securepassword123",
@@ -355,12 +374,6 @@ class TestValidationMixinIntegration:
 
     def test_model_validation_chain(self) -> None:
         """Test multiple validations in sequence."""
-
-        class AppConfig(BaseModel, ValidationMixin):
-            api_key: str
-            api_secret: str
-            endpoint: str
-
         config = AppConfig(
             api_key="key-1234567890",
             api_secret="secret-1234567890",
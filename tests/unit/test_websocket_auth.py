@@ -2,42 +2,98 @@
 
 from __future__ import annotations
 
-import pytest
+import base64
+import hmac
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
+from mcp_common.auth.exceptions import TokenExpiredError, TokenInvalidError
+from mcp_common.websocket import auth as auth_module
 from mcp_common.websocket.auth import (
     WebSocketAuthenticator,
     generate_test_token,
 )
 
+# Module fixtures are shared within a worker; the ``auth`` fixture's verify
+# cache is mutable, so tests must not depend on it being cold (tests counting
+# decodes build their own uncached authenticator). With that, the file can be
+# distributed across xdist workers (e.g. ``pytest -n auto --dist=loadfile``).
+pytestmark = pytest.mark.unit
+
+
+def _b64url(data: dict[str, object]) -> str:
+    """Encode ``data`` as an unpadded base64url JSON segment, as JWTs do."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def freeze_auth_clock(monkeypatch: pytest.MonkeyPatch, now: datetime) -> None:
+    """Make ``datetime.now()`` in the auth module always return ``now``."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(auth_module, "datetime", FrozenDatetime)
+
+
+@pytest.fixture(scope="module")
+def auth() -> WebSocketAuthenticator:
+    """Shared authenticator for tests that only use the default secret."""
+    return WebSocketAuthenticator(secret="test-secret")
+
+
+@pytest.fixture(scope="module")
+def valid_token(auth: WebSocketAuthenticator) -> str:
+    """Token for ``user123`` with read/write permissions, signed once per module."""
+    return auth.create_token({
+        "user_id": "user123",
+        "permissions": ["read", "write"]
+    })
+
+
+@pytest.fixture(scope="module")
+def admin_token(auth: WebSocketAuthenticator) -> str:
+    """Token for ``user123`` that also carries the admin permission."""
+    return auth.create_token({
+        "user_id": "user123",
+        "permissions": ["read", "write", "admin"]
+    })
+
+
+@pytest.fixture(scope="module")
+def token_parts(valid_token: str) -> tuple[str, str, str]:
+    """``valid_token`` split once into its header, payload and signature."""
+    header, payload, signature = valid_token.split(".")
+    return header, payload, signature
+
 
-@pytest.mark.unit
 class TestWebSocketAuthenticator:
     """Test WebSocketAuthenticator class."""
 
-    def test_create_token(self):
+    def test_create_token(self, valid_token):
         """Test creating a JWT token."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-        token = auth.create_token({
-            "user_id": "user123",
-            "permissions": ["read", "write"]
-        })
+        token = valid_token
 
         assert isinstance(token, str)
         assert len(token) > 0
-        # JWT tokens have 3 parts separated by dots
-        assert token.count(".") == 2
+        # JWT tokens have 3 non-empty parts separated by dots
+        header, _, rest = token.partition(".")
+        payload, _, signature = rest.partition(".")
+        assert header and payload and signature
+        assert "." not in signature
 
-    def test_verify_valid_token(self):
+    def test_verify_valid_token(self, auth, valid_token):
         """Test verifying a valid JWT token."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-        original_payload = {
-            "user_id": "user123",
-            "permissions": ["read", "write"]
-        }
-
-        token = auth.create_token(original_payload)
-        payload = auth.verify_token(token)
+        payload = auth.verify_token(valid_token)
 
         assert payload is not None
         assert payload["user_id"] == "user123"
@@ -45,24 +101,39 @@ class TestWebSocketAuthenticator:
         assert "exp" in payload
         assert "iat" in payload
 
-    def test_verify_invalid_token(self):
-        """Test that invalid tokens are rejected."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-
-        payload = auth.verify_token("invalid-token")
+    @pytest.mark.parametrize("method", ["verify_token", "authenticate_connection"])
+    @pytest.mark.parametrize(
+        "make_token",
+        [
+            pytest.param(lambda: "invalid-token", id="invalid-string"),
+            pytest.param(
+                lambda: WebSocketAuthenticator(secret="other-secret").create_token(
+                    {"user_id": "user123"}
+                ),
+                id="wrong-secret",
+            ),
+            pytest.param(lambda: "", id="empty"),
+        ],
+    )
+    def test_rejected_token(self, auth, make_token, method):
+        """Test that invalid tokens are rejected by verify and authenticate."""
+        payload = getattr(auth, method)(make_token())
         assert payload is None
 
-    def test_verify_token_with_wrong_secret(self):
-        """Test that tokens signed with different secret are rejected."""
-        auth1 = WebSocketAuthenticator(secret="secret-one")
-        auth2 = WebSocketAuthenticator(secret="secret-two")
-
-        token = auth1.create_token({"user_id": "user123"})
-        payload = auth2.verify_token(token)
+    @pytest.mark.parametrize("verify_cache_size", [1024, 0], ids=["cached", "uncached"])
+    @pytest.mark.parametrize("token", [["a"], {"t": 1}, 123], ids=["list", "dict", "int"])
+    def test_rejected_non_str_token(self, token, verify_cache_size):
+        """Test non-str tokens are rejected, not crashed on, with or without cache."""
+        auth = WebSocketAuthenticator(
+            secret="test-secret", verify_cache_size=verify_cache_size
+        )
 
-        assert payload is None
+        assert auth.verify_token(token) is None
+        assert auth.authenticate_connection(token) is None
+        with pytest.raises(TokenInvalidError):
+            auth.decode_token(token)
 
-    def test_token_expiry(self):
+    def test_token_expiry(self, monkeypatch: pytest.MonkeyPatch):
         """Test that expired tokens are rejected."""
         auth = WebSocketAuthenticator(
             secret="test-secret",
@@ -75,40 +146,44 @@ class TestWebSocketAuthenticator:
         payload = auth.verify_token(token)
         assert payload is not None
 
-        # Wait for token to expire
-        import time
-        time.sleep(2)
+        # Issue the token from a clock 2 seconds in the past instead of sleeping;
+        # PyJWT still checks ``exp`` against the real clock.
+        freeze_auth_clock(monkeypatch, datetime.now(UTC) - timedelta(seconds=2))
+        token = auth.create_token({"user_id": "user123"})
 
         # Token should now be expired
         payload = auth.verify_token(token)
         assert payload is None
 
-    def test_authenticate_connection_success(self):
+    def test_authenticate_connection_success(self, auth, valid_token):
         """Test authenticating a connection with valid token."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-        token = auth.create_token({
-            "user_id": "user123",
-            "permissions": ["read", "write"]
-        })
-
-        payload = auth.authenticate_connection(token)
+        payload = auth.authenticate_connection(valid_token)
         assert payload is not None
         assert payload["user_id"] == "user123"
+        assert payload["permissions"] == ["read", "write"]
+        assert "exp" in payload
+        assert "iat" in payload
 
-    def test_authenticate_connection_invalid_token(self):
-        """Test authenticating a connection with invalid token."""
-        auth = WebSocketAuthenticator(secret="test-secret")
+    def test_authenticate_connection_decodes_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test authenticate_connection decodes the token exactly once."""
+        auth = WebSocketAuthenticator(secret="test-secret", verify_cache_size=0)
+        token = auth.create_token({"user_id": "user123", "permissions": ["admin"]})
+        decode = Mock(wraps=auth_module.jwt.decode)
+        monkeypatch.setattr(auth_module.jwt, "decode", decode)
 
-        payload = auth.authenticate_connection("invalid-token")
-        assert payload is None
+        payload = auth.authenticate_connection(
+            token,
+            required_permissions=["admin"]
+        )
 
-    def test_authenticate_connection_with_permissions(self):
+        assert payload is not None
+        assert decode.call_count == 1
+
+    def test_authenticate_connection_with_permissions(self, auth, admin_token):
         """Test authenticating with required permissions."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-        token = auth.create_token({
-            "user_id": "user123",
-            "permissions": ["read", "write", "admin"]
-        })
+        token = admin_token
 
         # Should succeed with matching permissions
         payload = auth.authenticate_connection(
@@ -133,11 +208,128 @@ class TestWebSocketAuthenticator:
         assert auth.algorithm == "HS256"
 
 
-@pytest.mark.unit
+class TestDecodeToken:
+    """Test the raising decode_token API."""
+
+    def test_decode_valid_token(self, auth, valid_token):
+        """Test decode_token returns the payload for a valid token."""
+        payload = auth.decode_token(valid_token)
+
+        assert payload["user_id"] == "user123"
+        assert payload["permissions"] == ["read", "write"]
+
+    def test_decode_invalid_token_raises(self, auth):
+        """Test malformed tokens raise TokenInvalidError."""
+        with pytest.raises(TokenInvalidError):
+            auth.decode_token("invalid-token")
+
+    def test_decode_wrong_secret_raises(self, auth):
+        """Test tokens signed with another secret raise TokenInvalidError."""
+        token = WebSocketAuthenticator(secret="other-secret").create_token(
+            {"user_id": "user123"}
+        )
+
+        with pytest.raises(TokenInvalidError):
+            auth.decode_token(token)
+
+    def test_decode_expired_token_raises(self, monkeypatch: pytest.MonkeyPatch):
+        """Test expired tokens raise TokenExpiredError."""
+        auth = WebSocketAuthenticator(secret="test-secret", token_expiry=1)
+        freeze_auth_clock(monkeypatch, datetime.now(UTC) - timedelta(seconds=2))
+        token = auth.create_token({"user_id": "user123"})
+
+        with pytest.raises(TokenExpiredError):
+            auth.decode_token(token)
+
+
+class TestVerifyCache:
+    """Test caching of successfully verified tokens."""
+
+    @pytest.fixture
+    def compare_digest(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Count HMAC signature checks."""
+        compare_digest = Mock(wraps=hmac.compare_digest)
+        monkeypatch.setattr(hmac, "compare_digest", compare_digest)
+        return compare_digest
+
+    def test_repeat_verify_skips_signature_check(self, compare_digest):
+        """Test verifying the same token twice only checks the signature once."""
+        auth = WebSocketAuthenticator(secret="test-secret")
+        token = auth.create_token({"user_id": "user123"})
+
+        first = auth.verify_token(token)
+        second = auth.verify_token(token)
+
+        assert first is not None
+        assert second == first
+        assert compare_digest.call_count == 1
+
+    def test_cache_disabled(self, compare_digest):
+        """Test verify_cache_size=0 checks the signature on every call."""
+        auth = WebSocketAuthenticator(secret="test-secret", verify_cache_size=0)
+        token = auth.create_token({"user_id": "user123"})
+
+        assert auth.verify_token(token) is not None
+        assert auth.verify_token(token) is not None
+        assert compare_digest.call_count == 2
+
+    def test_cached_payload_is_copied(self):
+        """Test mutating a returned payload does not leak into later calls."""
+        auth = WebSocketAuthenticator(secret="test-secret")
+        token = auth.create_token({"user_id": "user123", "permissions": ["read"]})
+
+        payload = auth.verify_token(token)
+        assert payload is not None
+        payload["permissions"].append("admin")
+
+        assert auth.authenticate_connection(token, ["admin"]) is None
+
+    def test_expired_token_not_served_from_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a cached token is rejected once its ``exp`` has passed."""
+        auth = WebSocketAuthenticator(secret="test-secret", token_expiry=60)
+        token = auth.create_token({"user_id": "user123"})
+        assert auth.verify_token(token) is not None
+
+        later = time.time() + 120
+        monkeypatch.setattr(auth_module, "time", SimpleNamespace(time=lambda: later))
+
+        assert auth.verify_token(token) is None
+
+    def test_concurrent_verify(self):
+        """Test many threads can verify through the shared cache at once."""
+        auth = WebSocketAuthenticator(secret="test-secret", verify_cache_size=16)
+        # More distinct tokens than cache slots, so threads race on both hits
+        # and evictions.
+        tokens = [auth.create_token({"user_id": f"user{i}"}) for i in range(32)]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(
+                executor.map(
+                    lambda i: auth.verify_token(tokens[i % len(tokens)]), range(2000)
+                )
+            )
+
+        assert [payload["user_id"] for payload in results if payload] == [
+            f"user{i % len(tokens)}" for i in range(2000)
+        ]
+
+    def test_secret_change_bypasses_cache(self):
+        """Test a cached token is re-verified after the secret changes."""
+        auth = WebSocketAuthenticator(secret="test-secret")
+        token = auth.create_token({"user_id": "user123"})
+        assert auth.verify_token(token) is not None
+
+        auth.secret = "rotated-secret"
+
+        assert auth.verify_token(token) is None
+
+
 class TestGenerateTestToken:
     """Test generate_test_token utility function."""
 
-    def test_generate_test_token_default(self):
+    def test_generate_test_token_default(self, auth):
         """Test generating a test token with default parameters."""
         token = generate_test_token("user123")
 
@@ -145,33 +337,30 @@ class TestGenerateTestToken:
         assert len(token) > 0
 
         # Verify it can be decoded with the default secret
-        auth = WebSocketAuthenticator(secret="test-secret")
         payload = auth.verify_token(token)
 
         assert payload is not None
         assert payload["user_id"] == "user123"
         assert payload["permissions"] == ["read"]
 
-    def test_generate_test_token_with_permissions(self):
+    def test_generate_test_token_with_permissions(self, auth):
         """Test generating a test token with custom permissions."""
         token = generate_test_token(
             "user123",
             permissions=["read", "write", "admin"]
         )
 
-        auth = WebSocketAuthenticator(secret="test-secret")
         payload = auth.verify_token(token)
 
         assert payload is not None
         assert payload["permissions"] == ["read", "write", "admin"]
 
-    def test_generate_test_token_custom_secret(self):
+    def test_generate_test_token_custom_secret(self, auth):
         """Test generating a test token with custom secret."""
         token = generate_test_token("user123", secret="custom-secret")
 
         # Should fail with default secret
-        auth1 = WebSocketAuthenticator(secret="test-secret")
-        payload1 = auth1.verify_token(token)
+        payload1 = auth.verify_token(token)
         assert payload1 is None
 
         # Should succeed with custom secret
@@ -179,17 +368,30 @@ class TestGenerateTestToken:
         payload2 = auth2.verify_token(token)
         assert payload2 is not None
 
+    def test_generate_test_token_reuses_authenticator(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test repeated calls with one secret share a single authenticator."""
+        auth_module._test_authenticator.cache_clear()
+        created = Mock(wraps=WebSocketAuthenticator)
+        monkeypatch.setattr(auth_module, "WebSocketAuthenticator", created)
+
+        try:
+            generate_test_token("user1")
+            generate_test_token("user2")
+            generate_test_token("user3", secret="custom-secret")
+        finally:
+            auth_module._test_authenticator.cache_clear()
+
+        assert created.call_count == 2
+
 
-@pytest.mark.unit
 class TestTokenClaims:
     """Test token claim structure."""
 
-    def test_token_contains_standard_claims(self):
+    def test_token_contains_standard_claims(self, auth, valid_token):
         """Test that tokens contain standard JWT claims."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-        token = auth.create_token({"user_id": "user123"})
-
-        payload = auth.verify_token(token)
+        payload = auth.verify_token(valid_token)
         # ``verify_token`` returns ``dict | None``; narrow before subscripting
         # so strict type checkers are satisfied.
         assert payload is not None
@@ -206,62 +408,138 @@ class TestTokenClaims:
         assert isinstance(exp_ts, (int, float))
         assert exp_ts > iat_ts
 
-    def test_token_expiry_time(self):
+    def test_token_expiry_time(self, monkeypatch: pytest.MonkeyPatch):
         """Test that token expiry is set correctly."""
         auth = WebSocketAuthenticator(
             secret="test-secret",
             token_expiry=3600  # 1 hour
         )
-        before = datetime.now(UTC)
+        # Whole seconds, since JWT timestamps are integers
+        issued_at = datetime.now(UTC).replace(microsecond=0)
+        freeze_auth_clock(monkeypatch, issued_at)
         token = auth.create_token({"user_id": "user123"})
 
         payload = auth.verify_token(token)
         assert payload is not None
 
-        exp = datetime.fromtimestamp(payload["exp"], UTC)
-        expected_expiry = before + timedelta(seconds=3600)
+        assert payload["iat"] == int(issued_at.timestamp())
+        assert payload["exp"] == int((issued_at + timedelta(seconds=3600)).timestamp())
 
-        # Allow 1 second tolerance
-        time_diff = abs((exp - expected_expiry).total_seconds())
-        assert time_diff < 1.0
 
-
-@pytest.mark.unit
 class TestAuthErrorHandling:
     """Test error handling in authentication."""
 
-    def test_malformed_token(self):
+    @pytest.mark.parametrize(
+        "bad_token",
+        [
+            pytest.param("only.two", id="two-parts"),
+            pytest.param("onlyone", id="one-part"),
+            pytest.param("", id="empty"),
+            pytest.param("a.b.c.d", id="four-parts"),
+            pytest.param("...", id="empty-parts"),
+            pytest.param("🙂.🙂.🙂", id="non-ascii"),
+        ],
+    )
+    def test_malformed_token(self, auth, bad_token):
         """Test handling of malformed tokens."""
-        auth = WebSocketAuthenticator(secret="test-secret")
-
-        # Missing parts
-        assert auth.verify_token("only.two") is None
-        assert auth.verify_token("onlyone") is None
+        assert auth.verify_token(bad_token) is None
+
+    @pytest.mark.parametrize(
+        ("index", "replacement"),
+        [
+            pytest.param(0, _b64url({"alg": "none", "typ": "JWT"}), id="header"),
+            pytest.param(
+                1, _b64url({"user_id": "admin", "permissions": ["admin"]}), id="payload"
+            ),
+            pytest.param(
+                2,
+                base64.urlsafe_b64encode(bytes(32)).rstrip(b"=").decode(),
+                id="signature",
+            ),
+        ],
+    )
+    def test_tampered_token(self, auth, token_parts, index, replacement):
+        """Test that tokens with a tampered segment are rejected."""
+        parts = list(token_parts)
+        parts[index] = replacement
+
+        payload = auth.verify_token(".".join(parts))
+        assert payload is None
 
-        # Empty token
-        assert auth.verify_token("") is None
+    def test_signature_uses_constant_time_compare(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test HMAC signatures are checked with ``hmac.compare_digest``.
 
-    def test_token_with_invalid_signature(self):
-        """Test that tokens with tampered signatures are rejected."""
-        auth = WebSocketAuthenticator(secret="test-secret")
+        A plain ``==`` on signatures leaks timing information; this guards
+        against a future verify path regressing to it.
+        """
+        auth = WebSocketAuthenticator(secret="test-secret", verify_cache_size=0)
         token = auth.create_token({"user_id": "user123"})
+        compare_digest = Mock(wraps=hmac.compare_digest)
+        monkeypatch.setattr(hmac, "compare_digest", compare_digest)
+
+        assert auth.verify_token(token) is not None
+        assert compare_digest.call_count == 1
+
+
+class TestModuleInvariants:
+    """Test import-time properties of the auth module."""
+
+    def test_annotations_are_postponed(self):
+        """Test annotations stay unevaluated strings, keeping import cheap."""
+        hints = WebSocketAuthenticator.verify_token.__annotations__
+        assert hints
+        assert all(isinstance(hint, str) for hint in hints.values())
+
+    def test_imports_without_pyjwt(self):
+        """Test the module still imports, flagged unavailable, when PyJWT is missing."""
+        script = (
+            "import sys\n"
+            "sys.modules['jwt'] = None\n"
+            "from mcp_common.websocket import auth\n"
+            "assert auth.JWT_AVAILABLE is False\n"
+            "assert 'mcp_common.auth' not in sys.modules\n"
+        )
 
-        # Tamper with token by changing signature
-        parts = token.split(".")
-        if len(parts) == 3:
-            tampered_token = f"{parts[0]}.{parts[1]}.tamperedsignature"
-            payload = auth.verify_token(tampered_token)
-            assert payload is None
-
-    def test_authenticate_without_authenticator_configured(self):
-        """Test authenticate method when authenticator is not configured."""
-        # This is handled in WebSocketServer class
-        # Here we just verify authenticator's own error handling
-        auth = WebSocketAuthenticator(secret="test-secret")
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=False, text=True
+        )
 
-        # Valid token
-        token = auth.create_token({"user_id": "user123"})
-        assert auth.authenticate_connection(token) is not None
+        assert result.returncode == 0, result.stderr
+
+    def test_auth_package_import_errors_are_not_masked(self):
+        """Test a broken mcp_common.auth surfaces instead of disabling JWT."""
+        script = (
+            "import sys\n"
+            "sys.modules['mcp_common.auth.exceptions'] = None\n"
+            "from mcp_common.websocket import auth\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=False, text=True
+        )
+
+        assert result.returncode != 0
+        assert "mcp_common.auth.exceptions" in result.stderr
+
+    def test_utc_is_module_constant(self):
+        """Test the auth module uses the shared ``datetime.UTC`` singleton."""
+        assert auth_module.UTC is UTC
+
+    def test_create_token_reads_clock_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Test exp and iat come from one ``datetime.now(UTC)`` call."""
+        now = Mock(return_value=datetime.now(UTC))
+
+        class CountingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now(tz)
+
+        monkeypatch.setattr(auth_module, "datetime", CountingDatetime)
+        auth = WebSocketAuthenticator(secret="test-secret", token_expiry=90)
+
+        payload = auth.decode_token(auth.create_token({"user_id": "user123"}))
 
-        # Invalid token
-        assert auth.authenticate_connection("invalid") is None
+        now.assert_called_once_with(UTC)
+        assert payload["exp"] - payload["iat"] == 90